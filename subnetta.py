@@ -10,11 +10,13 @@ Supports Classes A, B, and C with interactive step-by-step guidance.
 import sys
 import os
 import ipaddress
-import argparse
-import math
 import subprocess
 import importlib.util
-from typing import Tuple, List, Dict, Optional, Union
+from typing import Tuple, List, Dict, Optional, Union, Iterable, Iterator
+
+
+# Results of DependencyManager.check_dependency, keyed by package name
+_dependency_cache: Dict[str, bool] = {}
 
 
 class DependencyManager:
@@ -22,9 +24,18 @@ class DependencyManager:
     
     @staticmethod
     def check_dependency(package_name: str) -> bool:
-        """Check if a package is installed."""
-        spec = importlib.util.find_spec(package_name)
-        return spec is not None
+        """Check if a package is installed, without importing it."""
+        if package_name in _dependency_cache:
+            return _dependency_cache[package_name]
+        
+        try:
+            available = importlib.util.find_spec(package_name) is not None
+        except (ImportError, ValueError):
+            # Raised for dotted names whose parent package is missing
+            available = False
+        
+        _dependency_cache[package_name] = available
+        return available
     
     @staticmethod
     def install_dependency(package_name: str) -> bool:
@@ -33,6 +44,9 @@ class DependencyManager:
             subprocess.check_call([
                 sys.executable, "-m", "pip", "install", package_name
             ], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            # Forget cached lookups so the new package is found
+            importlib.invalidate_caches()
+            _dependency_cache.pop(package_name, None)
             return True
         except (subprocess.CalledProcessError, FileNotFoundError):
             return False
@@ -43,6 +57,10 @@ class DependencyManager:
         if DependencyManager.check_dependency("colorama"):
             return True
         
+        # Don't block piped or scripted runs on an install prompt
+        if not (sys.stdin.isatty() and sys.stdout.isatty()):
+            return False
+        
         try:
             choice = input("colorama library not found. Do you want me to install it now? (Y/n): ").strip().lower()
             if choice in ['', 'y', 'yes']:
@@ -64,8 +82,29 @@ class DependencyManager:
 class Colors:
     """Color constants for terminal output."""
     
+    __slots__ = (
+        'RED', 'GREEN', 'YELLOW', 'BLUE', 'MAGENTA', 'CYAN', 'WHITE',
+        'BOLD', 'RESET', 'enabled'
+    )
+    
+    # Shared instance for use_colors=False; it never changes once built
+    _disabled_instance = None
+    
+    def __new__(cls, use_colors: bool = True):
+        if use_colors:
+            return super().__new__(cls)
+        
+        if cls._disabled_instance is None:
+            instance = super().__new__(cls)
+            instance._disable_colors()
+            cls._disabled_instance = instance
+        return cls._disabled_instance
+    
     def __init__(self, use_colors: bool = True):
-        if use_colors and DependencyManager.check_dependency("colorama"):
+        if not use_colors:
+            return  # Already set up by __new__
+        
+        if DependencyManager.check_dependency("colorama"):
             try:
                 from colorama import Fore, Back, Style, init
                 init(autoreset=True)
@@ -91,6 +130,109 @@ class Colors:
         self.enabled = False
 
 
+_DEFAULT_MASK = {
+    'A': ('255.0.0.0', 8),
+    'B': ('255.255.0.0', 16),
+    'C': ('255.255.255.0', 24),
+}
+
+# (ip_class, default_mask, default_prefix) by first octet; loopback counts
+# as Class A, and multicast, reserved and 0.x addresses default to Class C
+_CLASS_INFO = tuple(
+    (ip_class,) + _DEFAULT_MASK[ip_class]
+    for ip_class in (
+        'A' if 1 <= octet <= 127 else 'B' if 128 <= octet <= 191 else 'C'
+        for octet in range(256)
+    )
+)
+
+# Private address ranges as (network, netmask) pairs. This is the fixed
+# definition from the Python 3.13 ipaddress module (IANA special-purpose
+# registry), used on every interpreter so results don't depend on which
+# Python runs Subnetta. 192.0.0.170/31 is covered by 192.0.0.0/24.
+_PRIVATE_RANGES = (
+    (0x00000000, 0xFF000000),  # 0.0.0.0/8
+    (0x0A000000, 0xFF000000),  # 10.0.0.0/8
+    (0x7F000000, 0xFF000000),  # 127.0.0.0/8
+    (0xA9FE0000, 0xFFFF0000),  # 169.254.0.0/16
+    (0xAC100000, 0xFFF00000),  # 172.16.0.0/12
+    (0xC0000000, 0xFFFFFF00),  # 192.0.0.0/24
+    (0xC0000200, 0xFFFFFF00),  # 192.0.2.0/24
+    (0xC0A80000, 0xFFFF0000),  # 192.168.0.0/16
+    (0xC6120000, 0xFFFE0000),  # 198.18.0.0/15
+    (0xC6336400, 0xFFFFFF00),  # 198.51.100.0/24
+    (0xCB007100, 0xFFFFFF00),  # 203.0.113.0/24
+    (0xF0000000, 0xF0000000),  # 240.0.0.0/4
+    (0xFFFFFFFF, 0xFFFFFFFF),  # 255.255.255.255/32
+)
+
+# Globally reachable addresses inside 192.0.0.0/24 (PCP and TURN anycast)
+_PRIVATE_EXCEPTIONS = (
+    0xC0000009,  # 192.0.0.9
+    0xC000000A,  # 192.0.0.10
+)
+
+
+def _is_private_int(value: int) -> bool:
+    """Check an integer address against the private ranges."""
+    if value in _PRIVATE_EXCEPTIONS:
+        return False
+    for network, netmask in _PRIVATE_RANGES:
+        if value & netmask == network:
+            return True
+    return False
+
+
+def _is_loopback_int(value: int) -> bool:
+    """Check an integer address against 127.0.0.0/8."""
+    return value & 0xFF000000 == 0x7F000000
+
+
+def _is_multicast_int(value: int) -> bool:
+    """Check an integer address against 224.0.0.0/4."""
+    return 0xE0000000 <= value <= 0xEFFFFFFF
+
+
+def _parse_ipv4_fast(ip_str: str) -> Optional[int]:
+    """
+    Parse a dotted decimal IPv4 address into a 32-bit integer.
+    
+    Walks the string once, accumulating each octet in place, so no
+    intermediate lists or substrings are created.
+    
+    Returns:
+        Integer value of the address, or None if the string is not valid
+    """
+    length = len(ip_str)
+    if length < 7 or length > 15 or not ip_str.isascii():
+        return None
+    
+    value = 0
+    octet = -1  # -1 until the current octet has a digit
+    dots = 0
+    
+    for char in ip_str.encode('ascii'):
+        if char == 0x2E:  # '.'
+            if octet < 0:
+                return None
+            value = (value << 8) | octet
+            octet = -1
+            dots += 1
+            continue
+        
+        digit = char - 0x30
+        # A digit after a leading zero is rejected, as ipaddress does
+        if digit < 0 or digit > 9 or octet == 0:
+            return None
+        octet = digit if octet < 0 else octet * 10 + digit
+        if octet > 255:
+            return None
+    
+    if dots != 3 or octet < 0:
+        return None
+    return (value << 8) | octet
+
+
 class IPv4Validator:
     """Handles IPv4 address validation and classification."""
     
@@ -102,11 +244,23 @@ class IPv4Validator:
         Returns:
             Tuple of (is_valid, IPv4Address object or None)
         """
-        try:
-            ip = ipaddress.IPv4Address(ip_str)
-            return True, ip
-        except ipaddress.AddressValueError:
+        value = _parse_ipv4_fast(ip_str)
+        if value is None:
             return False, None
+        return True, ipaddress.IPv4Address(value)
+    
+    @staticmethod
+    def validate_many(ip_strs: Iterable[str]) -> Iterator[Tuple[bool, Optional[int]]]:
+        """
+        Validate many IPv4 address strings without building address objects.
+        
+        Yields:
+            Tuple of (is_valid, integer value or None) for each input
+        """
+        parse = _parse_ipv4_fast
+        for ip_str in ip_strs:
+            value = parse(ip_str)
+            yield value is not None, value
     
     @staticmethod
     def get_ip_class(ip: ipaddress.IPv4Address) -> str:
@@ -116,17 +270,17 @@ class IPv4Validator:
         Returns:
             'A', 'B', or 'C'
         """
-        first_octet = int(str(ip).split('.')[0])
-        
-        if 1 <= first_octet <= 126 or first_octet == 127:  # Include loopback in Class A
-            return 'A'
-        elif 128 <= first_octet <= 191:
-            return 'B'
-        elif 192 <= first_octet <= 223:
-            return 'C'
-        else:
-            # For multicast, reserved, etc., default to C
-            return 'C'
+        return _CLASS_INFO[int(ip) >> 24][0]
+    
+    @staticmethod
+    def get_class_info(ip: ipaddress.IPv4Address) -> Tuple[str, str, int]:
+        """
+        Get the class and default mask of an IPv4 address in one lookup.
+        
+        Returns:
+            Tuple of (ip_class, subnet_mask, prefix_length)
+        """
+        return _CLASS_INFO[int(ip) >> 24]
     
     @staticmethod
     def get_default_mask(ip_class: str) -> Tuple[str, int]:
@@ -136,27 +290,110 @@ class IPv4Validator:
         Returns:
             Tuple of (subnet_mask, prefix_length)
         """
-        if ip_class == 'A':
-            return '255.0.0.0', 8
-        elif ip_class == 'B':
-            return '255.255.0.0', 16
-        else:  # Class C
-            return '255.255.255.0', 24
+        return _DEFAULT_MASK.get(ip_class, _DEFAULT_MASK['C'])
+    
+    @staticmethod
+    def get_ip_type(ip: ipaddress.IPv4Address) -> str:
+        """
+        Classify an IPv4 address from its integer value in a single pass.
+        
+        Private ranges take precedence, matching the order used for display.
+        
+        Returns:
+            'private', 'loopback', 'multicast', or 'public'
+        """
+        value = int(ip)
+        
+        if _is_private_int(value):
+            return 'private'
+        if _is_loopback_int(value):
+            return 'loopback'
+        if _is_multicast_int(value):
+            return 'multicast'
+        return 'public'
     
     @staticmethod
     def is_private_ip(ip: ipaddress.IPv4Address) -> bool:
         """Check if IP address is private."""
-        return ip.is_private
+        return _is_private_int(int(ip))
     
     @staticmethod
     def is_loopback(ip: ipaddress.IPv4Address) -> bool:
         """Check if IP address is loopback."""
-        return ip.is_loopback
+        return _is_loopback_int(int(ip))
     
     @staticmethod
     def is_multicast(ip: ipaddress.IPv4Address) -> bool:
         """Check if IP address is multicast."""
-        return ip.is_multicast
+        return _is_multicast_int(int(ip))
+
+
+def _format_ip(value: int) -> str:
+    """Format a 32-bit integer as a dotted decimal IPv4 address."""
+    return f"{value >> 24}.{(value >> 16) & 0xFF}.{(value >> 8) & 0xFF}.{value & 0xFF}"
+
+
+def _usable_bounds(network: int, broadcast: int) -> Tuple[int, int]:
+    """Get the first and last usable addresses between network and broadcast."""
+    if broadcast - network >= 3:
+        return network + 1, broadcast - 1
+    # /31 point-to-point links (RFC 3021) and /32 host routes use every address
+    return network, broadcast
+
+
+class LazySubnets:
+    """Sequence of subnets computed on demand instead of materialized up front."""
+    
+    def __init__(self, network_int: int, block_size: int, count: int, prefix_length: int):
+        self.network_int = network_int
+        self.block_size = block_size
+        self.count = count
+        self.prefix_length = prefix_length
+        # Base address of every subnet, stored as an O(1)-memory arithmetic range
+        self._bases = range(network_int, network_int + count * block_size, block_size)
+    
+    def __len__(self) -> int:
+        return self.count
+    
+    def __getitem__(self, index: Union[int, slice]) -> Union[ipaddress.IPv4Network, List[ipaddress.IPv4Network]]:
+        if isinstance(index, slice):
+            return [ipaddress.IPv4Network((base, self.prefix_length)) for base in self._bases[index]]
+        
+        try:
+            base = self._bases[index]
+        except IndexError:
+            raise IndexError("subnet index out of range") from None
+        return ipaddress.IPv4Network((base, self.prefix_length))
+    
+    def __iter__(self):
+        for base in self._bases:
+            yield ipaddress.IPv4Network((base, self.prefix_length))
+    
+    def address_rows(self, count: int) -> List[Tuple[int, int, int, int]]:
+        """
+        Get address boundaries for the first subnets as plain integers.
+        
+        Returns:
+            List of (network, first_usable, last_usable, broadcast) tuples
+        """
+        last_offset = self.block_size - 1
+        return [
+            (network, *_usable_bounds(network, network + last_offset), network + last_offset)
+            for network in self._bases[:count]
+        ]
+
+
+def _compute_subnet_plan(default_prefix: int, new_prefix: int) -> Tuple[int, int, int, int]:
+    """
+    Derive the integer parameters of splitting a network to a new prefix.
+    
+    Returns:
+        Tuple of (subnet_bits, host_bits, total_subnets, hosts_per_subnet)
+    """
+    subnet_bits = new_prefix - default_prefix
+    host_bits = 32 - new_prefix
+    # Subtract network and broadcast from the usable host count
+    return subnet_bits, host_bits, 1 << subnet_bits, (1 << host_bits) - 2
 
 
 class SubnetCalculator:
@@ -164,13 +401,17 @@ class SubnetCalculator:
     
     def __init__(self, ip: ipaddress.IPv4Address, ip_class: str):
         self.ip = ip
+        self.ip_int = int(ip)
         self.ip_class = ip_class
         self.default_mask, self.default_prefix = IPv4Validator.get_default_mask(ip_class)
     
     def calculate_from_subnets(self, num_subnets: int) -> Dict:
         """Calculate subnetting based on required number of subnets."""
-        # Calculate bits needed for subnets
-        subnet_bits = math.ceil(math.log2(num_subnets))
+        if num_subnets < 1:
+            raise ValueError(f"Number of subnets must be at least 1, got {num_subnets}.")
+        
+        # Calculate bits needed for subnets (exact integer ceil(log2))
+        subnet_bits = (num_subnets - 1).bit_length()
         
         # Calculate new prefix length
         new_prefix = self.default_prefix + subnet_bits
@@ -178,15 +419,18 @@ class SubnetCalculator:
         if new_prefix > 30:  # Maximum usable prefix for host addresses
             raise ValueError(f"Cannot create {num_subnets} subnets with class {self.ip_class}. Too many subnet bits required.")
         
-        return self._calculate_subnetting(new_prefix, subnet_bits)
+        return self._calculate_subnetting(new_prefix)
     
     def calculate_from_hosts(self, hosts_per_subnet: int) -> Dict:
         """Calculate subnetting based on required hosts per subnet."""
+        if hosts_per_subnet < 1:
+            raise ValueError(f"Number of hosts per subnet must be at least 1, got {hosts_per_subnet}.")
+        
         # Add 2 for network and broadcast addresses
         total_addresses_needed = hosts_per_subnet + 2
         
-        # Calculate bits needed for hosts
-        host_bits = math.ceil(math.log2(total_addresses_needed))
+        # Calculate bits needed for hosts (exact integer ceil(log2))
+        host_bits = (total_addresses_needed - 1).bit_length()
         
         # Calculate new prefix length
         new_prefix = 32 - host_bits
@@ -194,28 +438,27 @@ class SubnetCalculator:
         if new_prefix <= self.default_prefix:
             raise ValueError(f"Cannot accommodate {hosts_per_subnet} hosts per subnet with class {self.ip_class}. Not enough host bits available.")
         
-        subnet_bits = new_prefix - self.default_prefix
-        
-        return self._calculate_subnetting(new_prefix, subnet_bits)
+        return self._calculate_subnetting(new_prefix)
     
-    def _calculate_subnetting(self, new_prefix: int, subnet_bits: int) -> Dict:
+    def _calculate_subnetting(self, new_prefix: int) -> Dict:
         """Internal method to perform subnetting calculations."""
+        subnet_bits, host_bits, total_subnets, hosts_per_subnet = _compute_subnet_plan(
+            self.default_prefix, new_prefix
+        )
+        
         # Create network with new prefix
-        network = ipaddress.IPv4Network(f"{self.ip}/{new_prefix}", strict=False)
+        network = ipaddress.IPv4Network((self.ip_int, new_prefix), strict=False)
         
         # Calculate subnet mask and wildcard mask
         subnet_mask = str(network.netmask)
         wildcard_mask = str(network.hostmask)
         
-        # Calculate number of possible subnets and hosts
-        total_subnets = 2 ** subnet_bits
-        hosts_per_subnet = network.num_addresses - 2  # Subtract network and broadcast
-        
         # Get network address (first address in the original network)
-        original_network = ipaddress.IPv4Network(f"{self.ip}/{self.default_prefix}", strict=False)
+        original_network = ipaddress.IPv4Network((self.ip_int, self.default_prefix), strict=False)
+        network_int = int(original_network.network_address)
         
-        # Generate all subnets
-        subnets = list(original_network.subnets(new_prefix=new_prefix))
+        # Subnets are computed on demand so large splits stay cheap
+        subnets = LazySubnets(network_int, 1 << host_bits, total_subnets, new_prefix)
         
         return {
             'ip_class': self.ip_class,
@@ -227,20 +470,23 @@ class SubnetCalculator:
             'hosts_per_subnet': hosts_per_subnet,
             'subnets': subnets,
             'subnet_bits': subnet_bits,
-            'host_bits': 32 - new_prefix
+            'host_bits': host_bits
         }
     
-    def get_subnet_details(self, subnet_network: ipaddress.IPv4Network) -> Dict:
+    @staticmethod
+    def get_subnet_details(subnet_network: ipaddress.IPv4Network) -> Dict:
         """Get detailed information about a specific subnet."""
-        hosts = list(subnet_network.hosts())
+        first_usable, last_usable = _usable_bounds(
+            int(subnet_network.network_address), int(subnet_network.broadcast_address)
+        )
         
         return {
             'network_address': str(subnet_network.network_address),
             'broadcast_address': str(subnet_network.broadcast_address),
-            'first_usable_ip': str(hosts[0]) if hosts else "None",
-            'last_usable_ip': str(hosts[-1]) if hosts else "None",
+            'first_usable_ip': _format_ip(first_usable),
+            'last_usable_ip': _format_ip(last_usable),
             'total_addresses': subnet_network.num_addresses,
-            'usable_addresses': len(hosts),
+            'usable_addresses': last_usable - first_usable + 1,
             'subnet_mask': str(subnet_network.netmask),
             'prefix_length': subnet_network.prefixlen
         }
@@ -301,41 +547,44 @@ class SubnettaApp:
         print(f"\n{self.colors.BOLD}{self.colors.YELLOW}Step 1: IPv4 Address Input{self.colors.RESET}")
         print(f"{self.colors.WHITE}Please enter an IPv4 address (e.g., 192.168.1.0, 10.0.0.0){self.colors.RESET}")
         
+        ip = None
+        
         def validate_ip(ip_str):
-            is_valid, _ = IPv4Validator.validate_ipv4(ip_str)
+            nonlocal ip
+            is_valid, ip = IPv4Validator.validate_ipv4(ip_str)
             return is_valid
         
-        ip_str = self.get_user_input(
+        self.get_user_input(
             "IPv4 Address: ",
             validate_ip,
             "Invalid IPv4 address format. Please use dotted decimal notation (e.g., 192.168.1.0)"
         )
         
-        _, ip = IPv4Validator.validate_ipv4(ip_str)
         return ip
     
     def display_ip_info(self, ip: ipaddress.IPv4Address):
         """Display information about the IP address."""
-        ip_class = IPv4Validator.get_ip_class(ip)
-        is_private = IPv4Validator.is_private_ip(ip)
-        is_loopback = IPv4Validator.is_loopback(ip)
-        is_multicast = IPv4Validator.is_multicast(ip)
-        
-        print(f"\n{self.colors.BOLD}{self.colors.GREEN}IP Address Analysis:{self.colors.RESET}")
-        print(f"{self.colors.WHITE}IP Address: {self.colors.YELLOW}{ip}{self.colors.RESET}")
-        print(f"{self.colors.WHITE}IP Class: {self.colors.YELLOW}Class {ip_class}{self.colors.RESET}")
-        
-        if is_private:
-            print(f"{self.colors.WHITE}Type: {self.colors.GREEN}Private IP{self.colors.RESET}")
-        elif is_loopback:
-            print(f"{self.colors.WHITE}Type: {self.colors.BLUE}Loopback IP{self.colors.RESET}")
-        elif is_multicast:
-            print(f"{self.colors.WHITE}Type: {self.colors.MAGENTA}Multicast IP{self.colors.RESET}")
+        colors = self.colors
+        GREEN, YELLOW, BLUE, MAGENTA = colors.GREEN, colors.YELLOW, colors.BLUE, colors.MAGENTA
+        WHITE, BOLD, RESET = colors.WHITE, colors.BOLD, colors.RESET
+        
+        ip_class, default_mask, default_prefix = IPv4Validator.get_class_info(ip)
+        ip_type = IPv4Validator.get_ip_type(ip)
+        
+        print(f"\n{BOLD}{GREEN}IP Address Analysis:{RESET}")
+        print(f"{WHITE}IP Address: {YELLOW}{ip}{RESET}")
+        print(f"{WHITE}IP Class: {YELLOW}Class {ip_class}{RESET}")
+        
+        if ip_type == 'private':
+            print(f"{WHITE}Type: {GREEN}Private IP{RESET}")
+        elif ip_type == 'loopback':
+            print(f"{WHITE}Type: {BLUE}Loopback IP{RESET}")
+        elif ip_type == 'multicast':
+            print(f"{WHITE}Type: {MAGENTA}Multicast IP{RESET}")
         else:
-            print(f"{self.colors.WHITE}Type: {self.colors.YELLOW}Public IP{self.colors.RESET}")
+            print(f"{WHITE}Type: {YELLOW}Public IP{RESET}")
         
-        default_mask, default_prefix = IPv4Validator.get_default_mask(ip_class)
-        print(f"{self.colors.WHITE}Default Subnet Mask: {self.colors.YELLOW}{default_mask} (/{default_prefix}){self.colors.RESET}")
+        print(f"{WHITE}Default Subnet Mask: {YELLOW}{default_mask} (/{default_prefix}){RESET}")
     
     def get_subnetting_choice(self) -> str:
         """Get user's choice for subnetting method."""
@@ -374,34 +623,45 @@ class SubnettaApp:
     
     def display_subnetting_results(self, results: Dict):
         """Display comprehensive subnetting results."""
-        print(f"\n{self.colors.BOLD}{self.colors.GREEN}Subnetting Results:{self.colors.RESET}")
+        colors = self.colors
+        GREEN, YELLOW, BLUE, CYAN = colors.GREEN, colors.YELLOW, colors.BLUE, colors.CYAN
+        WHITE, BOLD, RESET = colors.WHITE, colors.BOLD, colors.RESET
+        
+        print(f"\n{BOLD}{GREEN}Subnetting Results:{RESET}")
         print("=" * 60)
         
-        print(f"{self.colors.WHITE}Original IP: {self.colors.YELLOW}{results['original_ip']}{self.colors.RESET}")
-        print(f"{self.colors.WHITE}IP Class: {self.colors.YELLOW}Class {results['ip_class']}{self.colors.RESET}")
-        print(f"{self.colors.WHITE}Subnet Mask: {self.colors.YELLOW}{results['subnet_mask']}{self.colors.RESET}")
-        print(f"{self.colors.WHITE}Prefix Length: {self.colors.YELLOW}/{results['prefix_length']}{self.colors.RESET}")
-        print(f"{self.colors.WHITE}Wildcard Mask: {self.colors.YELLOW}{results['wildcard_mask']}{self.colors.RESET}")
-        print(f"{self.colors.WHITE}Total Subnets: {self.colors.GREEN}{results['total_subnets']}{self.colors.RESET}")
-        print(f"{self.colors.WHITE}Usable Hosts per Subnet: {self.colors.GREEN}{results['hosts_per_subnet']}{self.colors.RESET}")
-        print(f"{self.colors.WHITE}Subnet Bits: {self.colors.BLUE}{results['subnet_bits']}{self.colors.RESET}")
-        print(f"{self.colors.WHITE}Host Bits: {self.colors.BLUE}{results['host_bits']}{self.colors.RESET}")
-        
-        print(f"\n{self.colors.BOLD}{self.colors.CYAN}First 10 Subnets:{self.colors.RESET}")
+        print(f"{WHITE}Original IP: {YELLOW}{results['original_ip']}{RESET}")
+        print(f"{WHITE}IP Class: {YELLOW}Class {results['ip_class']}{RESET}")
+        print(f"{WHITE}Subnet Mask: {YELLOW}{results['subnet_mask']}{RESET}")
+        print(f"{WHITE}Prefix Length: {YELLOW}/{results['prefix_length']}{RESET}")
+        print(f"{WHITE}Wildcard Mask: {YELLOW}{results['wildcard_mask']}{RESET}")
+        print(f"{WHITE}Total Subnets: {GREEN}{results['total_subnets']}{RESET}")
+        print(f"{WHITE}Usable Hosts per Subnet: {GREEN}{results['hosts_per_subnet']}{RESET}")
+        print(f"{WHITE}Subnet Bits: {BLUE}{results['subnet_bits']}{RESET}")
+        print(f"{WHITE}Host Bits: {BLUE}{results['host_bits']}{RESET}")
+        
+        print(f"\n{BOLD}{CYAN}First 10 Subnets:{RESET}")
         print("-" * 80)
-        print(f"{self.colors.BOLD}{'#':<3} {'Network':<18} {'First IP':<15} {'Last IP':<15} {'Broadcast':<15}{self.colors.RESET}")
+        print(f"{BOLD}{'#':<3} {'Network':<18} {'First IP':<15} {'Last IP':<15} {'Broadcast':<15}{RESET}")
         print("-" * 80)
         
-        for i, subnet in enumerate(results['subnets'][:10]):
-            details = SubnetCalculator(ipaddress.IPv4Address(results['original_ip']), results['ip_class']).get_subnet_details(subnet)
-            print(f"{self.colors.WHITE}{i+1:<3} {details['network_address']:<18} {details['first_usable_ip']:<15} {details['last_usable_ip']:<15} {details['broadcast_address']:<15}{self.colors.RESET}")
+        # Emit the whole table in one write rather than one print per row
+        rows = [
+            f"{WHITE}{i+1:<3} {_format_ip(network):<18} {_format_ip(first_usable):<15} {_format_ip(last_usable):<15} {_format_ip(broadcast):<15}{RESET}"
+            for i, (network, first_usable, last_usable, broadcast) in enumerate(results['subnets'].address_rows(10))
+        ]
+        sys.stdout.write("\n".join(rows) + "\n")
         
         if len(results['subnets']) > 10:
-            print(f"{self.colors.YELLOW}... and {len(results['subnets']) - 10} more subnets{self.colors.RESET}")
+            print(f"{YELLOW}... and {len(results['subnets']) - 10} more subnets{RESET}")
     
     def get_nth_subnet(self, results: Dict):
         """Handle nth subnet lookup."""
-        print(f"\n{self.colors.BOLD}{self.colors.YELLOW}Specific Subnet Lookup{self.colors.RESET}")
+        colors = self.colors
+        RED, GREEN, YELLOW, BLUE = colors.RED, colors.GREEN, colors.YELLOW, colors.BLUE
+        WHITE, BOLD, RESET = colors.WHITE, colors.BOLD, colors.RESET
+        
+        print(f"\n{BOLD}{YELLOW}Specific Subnet Lookup{RESET}")
         
         while True:
             choice = self.get_user_input(
@@ -419,23 +679,23 @@ class SubnettaApp:
             )
             
             if subnet_num > results['total_subnets']:
-                print(f"{self.colors.RED}Subnet number {subnet_num} exceeds total subnets ({results['total_subnets']}){self.colors.RESET}")
+                print(f"{RED}Subnet number {subnet_num} exceeds total subnets ({results['total_subnets']}){RESET}")
                 continue
             
             # Get the specific subnet (convert to 0-based index)
             subnet = results['subnets'][subnet_num - 1]
-            details = SubnetCalculator(ipaddress.IPv4Address(results['original_ip']), results['ip_class']).get_subnet_details(subnet)
+            details = SubnetCalculator.get_subnet_details(subnet)
             
-            print(f"\n{self.colors.BOLD}{self.colors.GREEN}Subnet #{subnet_num} Details:{self.colors.RESET}")
+            print(f"\n{BOLD}{GREEN}Subnet #{subnet_num} Details:{RESET}")
             print("=" * 50)
-            print(f"{self.colors.WHITE}Network Address: {self.colors.YELLOW}{details['network_address']}{self.colors.RESET}")
-            print(f"{self.colors.WHITE}Subnet Mask: {self.colors.YELLOW}{details['subnet_mask']}{self.colors.RESET}")
-            print(f"{self.colors.WHITE}Prefix Length: {self.colors.YELLOW}/{details['prefix_length']}{self.colors.RESET}")
-            print(f"{self.colors.WHITE}First Usable IP: {self.colors.GREEN}{details['first_usable_ip']}{self.colors.RESET}")
-            print(f"{self.colors.WHITE}Last Usable IP: {self.colors.GREEN}{details['last_usable_ip']}{self.colors.RESET}")
-            print(f"{self.colors.WHITE}Broadcast Address: {self.colors.YELLOW}{details['broadcast_address']}{self.colors.RESET}")
-            print(f"{self.colors.WHITE}Total Addresses: {self.colors.BLUE}{details['total_addresses']}{self.colors.RESET}")
-            print(f"{self.colors.WHITE}Usable Addresses: {self.colors.BLUE}{details['usable_addresses']}{self.colors.RESET}")
+            print(f"{WHITE}Network Address: {YELLOW}{details['network_address']}{RESET}")
+            print(f"{WHITE}Subnet Mask: {YELLOW}{details['subnet_mask']}{RESET}")
+            print(f"{WHITE}Prefix Length: {YELLOW}/{details['prefix_length']}{RESET}")
+            print(f"{WHITE}First Usable IP: {GREEN}{details['first_usable_ip']}{RESET}")
+            print(f"{WHITE}Last Usable IP: {GREEN}{details['last_usable_ip']}{RESET}")
+            print(f"{WHITE}Broadcast Address: {YELLOW}{details['broadcast_address']}{RESET}")
+            print(f"{WHITE}Total Addresses: {BLUE}{details['total_addresses']}{RESET}")
+            print(f"{WHITE}Usable Addresses: {BLUE}{details['usable_addresses']}{RESET}")
     
     def run(self):
         """Run the main application loop."""
@@ -493,26 +753,33 @@ class SubnettaApp:
 
 def main():
     """Main application entry point."""
-    # Setup argument parser
-    parser = argparse.ArgumentParser(
-        description="Subnetta - IPv4 Subnetting Tool",
-        epilog="Example: python subnetta.py"
-    )
-    parser.add_argument(
-        '--no-color', 
-        action='store_true', 
-        help='Disable colored output'
-    )
-    parser.add_argument(
-        '--version', 
-        action='version', 
-        version='Subnetta 1.0.0'
-    )
+    argv = sys.argv[1:]
     
-    args = parser.parse_args()
+    # argparse is only needed for help, version and error handling
+    if any(arg != '--no-color' for arg in argv):
+        import argparse
+        
+        # Setup argument parser
+        parser = argparse.ArgumentParser(
+            description="Subnetta - IPv4 Subnetting Tool",
+            epilog="Example: python subnetta.py"
+        )
+        parser.add_argument(
+            '--no-color', 
+            action='store_true', 
+            help='Disable colored output'
+        )
+        parser.add_argument(
+            '--version', 
+            action='version', 
+            version='Subnetta 1.0.0'
+        )
+        
+        use_colors = not parser.parse_args(argv).no_color
+    else:
+        use_colors = '--no-color' not in argv
     
     # Setup colors
-    use_colors = not args.no_color
     if use_colors:
         DependencyManager.setup_colorama()
     
@@ -6,16 +6,27 @@ Unit tests for Subnetta - IPv4 Subnetting Tool
 import unittest
 import ipaddress
 import sys
-import os
-
-# Add the parent directory to the path to import subnetta
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from unittest import mock
 
 from subnetta import (
-    IPv4Validator, SubnetCalculator, DependencyManager, Colors
+    IPv4Validator, SubnetCalculator, DependencyManager, Colors, main
 )
 
 
+# Address objects shared by the validator tests, built once at import
+_IPS = {
+    ip_str: ipaddress.IPv4Address(ip_str)
+    for ip_str in (
+        "0.0.0.0", "0.0.0.1", "8.8.8.8", "10.0.0.0", "10.0.0.1", "100.64.0.1",
+        "126.255.255.255", "127.0.0.1", "128.0.0.1", "169.254.1.1",
+        "172.16.0.1", "172.32.0.1", "191.255.255.255", "192.0.0.1",
+        "192.0.0.8", "192.0.0.9", "192.0.0.10", "192.0.0.170",
+        "192.168.1.1", "198.19.255.255", "223.255.255.255", "224.0.0.1",
+        "239.255.255.255", "240.0.0.1", "255.255.255.255",
+    )
+}
+
+
 class TestIPv4Validator(unittest.TestCase):
     """Test cases for IPv4Validator class."""
     
@@ -27,15 +38,21 @@ class TestIPv4Validator(unittest.TestCase):
             "172.16.0.1",
             "8.8.8.8",
             "127.0.0.1",
-            "255.255.255.255"
+            "255.255.255.255",
+            "0.0.0.0"
         ]
         
-        for ip_str in valid_ips:
-            with self.subTest(ip=ip_str):
-                is_valid, ip_obj = IPv4Validator.validate_ipv4(ip_str)
-                self.assertTrue(is_valid)
-                self.assertIsInstance(ip_obj, ipaddress.IPv4Address)
-                self.assertEqual(str(ip_obj), ip_str)
+        self.assertEqual(
+            list(IPv4Validator.validate_many(valid_ips)),
+            [(True, int(_IPS[ip_str])) for ip_str in valid_ips]
+        )
+        
+        results = [IPv4Validator.validate_ipv4(ip_str) for ip_str in valid_ips]
+        self.assertEqual(results, [(True, _IPS[ip_str]) for ip_str in valid_ips])
+        self.assertEqual(
+            [type(ip_obj) for _, ip_obj in results],
+            [ipaddress.IPv4Address] * len(valid_ips)
+        )
     
     def test_validate_ipv4_invalid_addresses(self):
         """Test validation of invalid IPv4 addresses."""
@@ -47,14 +64,25 @@ class TestIPv4Validator(unittest.TestCase):
             "abc.def.ghi.jkl",
             "",
             "192.168.1.256",
-            "192.168.999.1"
+            "192.168.999.1",
+            "192.168.01.1",
+            "192.168.1.1 ",
+            "192.168..1",
+            "1.2.3.١",
+            "00.1.1.1",
+            "1234.1.1.1",
+            ".1.2.3",
+            "1.2.3.4.",
         ]
         
-        for ip_str in invalid_ips:
-            with self.subTest(ip=ip_str):
-                is_valid, ip_obj = IPv4Validator.validate_ipv4(ip_str)
-                self.assertFalse(is_valid)
-                self.assertIsNone(ip_obj)
+        self.assertEqual(
+            list(IPv4Validator.validate_many(invalid_ips)),
+            [(False, None)] * len(invalid_ips)
+        )
+        self.assertEqual(
+            [IPv4Validator.validate_ipv4(ip_str) for ip_str in invalid_ips],
+            [(False, None)] * len(invalid_ips)
+        )
     
     def test_get_ip_class(self):
         """Test IP class detection."""
@@ -69,13 +97,19 @@ class TestIPv4Validator(unittest.TestCase):
             ("223.255.255.255", "C"),
             ("224.0.0.1", "C"),  # Multicast defaults to C
             ("127.0.0.1", "A"),  # Loopback
+            ("240.0.0.1", "C"),  # Reserved defaults to C
+            ("0.0.0.1", "C"),
         ]
         
         for ip_str, expected_class in test_cases:
             with self.subTest(ip=ip_str, expected=expected_class):
-                ip = ipaddress.IPv4Address(ip_str)
+                ip = _IPS[ip_str]
                 result_class = IPv4Validator.get_ip_class(ip)
                 self.assertEqual(result_class, expected_class)
+                self.assertEqual(
+                    IPv4Validator.get_class_info(ip),
+                    (expected_class,) + IPv4Validator.get_default_mask(expected_class)
+                )
     
     def test_get_default_mask(self):
         """Test default subnet mask retrieval."""
@@ -99,28 +133,63 @@ class TestIPv4Validator(unittest.TestCase):
             ("8.8.8.8", False, False, False),     # Public
             ("127.0.0.1", True, True, False),     # Loopback (considered private by ipaddress library)
             ("224.0.0.1", False, False, True),    # Multicast
+            ("239.255.255.255", False, False, True),  # Multicast
+            ("169.254.1.1", True, False, False),  # Link-local (private per ipaddress)
+            ("172.32.0.1", False, False, False),  # Just outside 172.16.0.0/12
+            ("240.0.0.1", True, False, False),    # Reserved (private per ipaddress)
+            ("192.0.0.8", True, False, False),    # IETF protocol assignments
+            ("192.0.0.9", False, False, False),   # Globally reachable exception
+            ("192.0.0.10", False, False, False),  # Globally reachable exception
         ]
         
         for ip_str, is_private, is_loopback, is_multicast in test_cases:
             with self.subTest(ip=ip_str):
-                ip = ipaddress.IPv4Address(ip_str)
+                ip = _IPS[ip_str]
                 self.assertEqual(IPv4Validator.is_private_ip(ip), is_private)
                 self.assertEqual(IPv4Validator.is_loopback(ip), is_loopback)
                 self.assertEqual(IPv4Validator.is_multicast(ip), is_multicast)
+    
+    def test_get_ip_type(self):
+        """Test single-pass IP type classification."""
+        test_cases = [
+            ("192.168.1.1", 'private'),
+            ("10.0.0.1", 'private'),
+            ("172.16.0.1", 'private'),
+            ("172.32.0.1", 'public'),
+            ("8.8.8.8", 'public'),
+            ("127.0.0.1", 'private'),      # Loopback is also private
+            ("169.254.1.1", 'private'),
+            ("100.64.0.1", 'public'),      # Shared address space is not private
+            ("192.0.0.8", 'private'),
+            ("192.0.0.9", 'public'),       # Exception inside 192.0.0.0/24
+            ("192.0.0.10", 'public'),      # Exception inside 192.0.0.0/24
+            ("192.0.0.170", 'private'),
+            ("198.19.255.255", 'private'),
+            ("224.0.0.1", 'multicast'),
+            ("239.255.255.255", 'multicast'),
+            ("240.0.0.1", 'private'),
+            ("255.255.255.255", 'private'),
+            ("0.0.0.0", 'private'),
+        ]
+        
+        for ip_str, expected in test_cases:
+            with self.subTest(ip=ip_str):
+                self.assertEqual(IPv4Validator.get_ip_type(_IPS[ip_str]), expected)
 
 
 class TestSubnetCalculator(unittest.TestCase):
     """Test cases for SubnetCalculator class."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.ip_a = ipaddress.IPv4Address("10.0.0.0")
-        self.ip_b = ipaddress.IPv4Address("172.16.0.0")
-        self.ip_c = ipaddress.IPv4Address("192.168.1.0")
+    @classmethod
+    def setUpClass(cls):
+        """Set up shared test fixtures (calculators hold no per-test state)."""
+        cls.ip_a = ipaddress.IPv4Address("10.0.0.0")
+        cls.ip_b = ipaddress.IPv4Address("172.16.0.0")
+        cls.ip_c = ipaddress.IPv4Address("192.168.1.0")
         
-        self.calc_a = SubnetCalculator(self.ip_a, "A")
-        self.calc_b = SubnetCalculator(self.ip_b, "B")
-        self.calc_c = SubnetCalculator(self.ip_c, "C")
+        cls.calc_a = SubnetCalculator(cls.ip_a, "A")
+        cls.calc_b = SubnetCalculator(cls.ip_b, "B")
+        cls.calc_c = SubnetCalculator(cls.ip_c, "C")
     
     def test_calculate_from_subnets_class_c(self):
         """Test subnet calculation based on number of subnets for Class C."""
@@ -138,6 +207,14 @@ class TestSubnetCalculator(unittest.TestCase):
         self.assertEqual(results['host_bits'], 6)
         self.assertEqual(len(results['subnets']), 4)
     
+    def test_subnets_and_hosts_agree(self):
+        """Test equivalent subnet and host requests give the same layout."""
+        by_subnets = self.calc_c.calculate_from_subnets(4)
+        by_hosts = self.calc_c.calculate_from_hosts(62)
+        
+        self.assertEqual(by_subnets['subnet_mask'], by_hosts['subnet_mask'])
+        self.assertEqual(list(by_subnets['subnets']), list(by_hosts['subnets']))
+    
     def test_calculate_from_hosts_class_c(self):
         """Test subnet calculation based on hosts per subnet for Class C."""
         # Request 30 hosts per subnet from 192.168.1.0/24
@@ -190,6 +267,56 @@ class TestSubnetCalculator(unittest.TestCase):
         self.assertEqual(details['subnet_mask'], '255.255.255.192')
         self.assertEqual(details['prefix_length'], 26)
     
+    def test_subnets_computed_on_demand(self):
+        """Test lazy subnet access matches ipaddress enumeration."""
+        results = self.calc_a.calculate_from_hosts(2)
+        subnets = results['subnets']
+        
+        self.assertEqual(len(subnets), 2 ** 22)
+        self.assertEqual(subnets[0], ipaddress.IPv4Network("10.0.0.0/30"))
+        self.assertEqual(subnets[1], ipaddress.IPv4Network("10.0.0.4/30"))
+        self.assertEqual(subnets[-1], ipaddress.IPv4Network("10.255.255.252/30"))
+        self.assertEqual(
+            subnets[:3],
+            list(ipaddress.IPv4Network("10.0.0.0/28").subnets(new_prefix=30))[:3]
+        )
+        
+        with self.assertRaises(IndexError):
+            subnets[len(subnets)]
+    
+    def test_subnet_address_rows(self):
+        """Test integer address rows match subnet details."""
+        results = self.calc_c.calculate_from_subnets(4)
+        rows = results['subnets'].address_rows(10)
+        
+        self.assertEqual(len(rows), 4)
+        for subnet, row in zip(results['subnets'][:4], rows):
+            details = SubnetCalculator.get_subnet_details(subnet)
+            self.assertEqual(
+                [str(ipaddress.IPv4Address(value)) for value in row],
+                [details['network_address'], details['first_usable_ip'],
+                 details['last_usable_ip'], details['broadcast_address']]
+            )
+        
+        # Rows stop at the last subnet of very large splits too
+        subnets = self.calc_a.calculate_from_hosts(2)['subnets']
+        rows = subnets.address_rows(5000)
+        self.assertEqual(len(rows), 5000)
+        self.assertEqual(rows[-1][0], int(subnets[4999].network_address))
+        self.assertEqual(rows[-1][3], int(subnets[4999].broadcast_address))
+    
+    def test_get_subnet_details_small_prefixes(self):
+        """Test /31 and /32 subnet details follow RFC 3021."""
+        details = SubnetCalculator.get_subnet_details(ipaddress.IPv4Network("192.168.1.0/31"))
+        self.assertEqual(details['first_usable_ip'], '192.168.1.0')
+        self.assertEqual(details['last_usable_ip'], '192.168.1.1')
+        self.assertEqual(details['usable_addresses'], 2)
+        
+        details = SubnetCalculator.get_subnet_details(ipaddress.IPv4Network("192.168.1.5/32"))
+        self.assertEqual(details['first_usable_ip'], '192.168.1.5')
+        self.assertEqual(details['last_usable_ip'], '192.168.1.5')
+        self.assertEqual(details['usable_addresses'], 1)
+    
     def test_error_handling_too_many_subnets(self):
         """Test error handling when requesting too many subnets."""
         with self.assertRaises(ValueError):
@@ -202,6 +329,20 @@ class TestSubnetCalculator(unittest.TestCase):
             # Try to fit 300 hosts in a Class C network (impossible)
             self.calc_c.calculate_from_hosts(300)
     
+    def test_error_handling_non_positive_subnets(self):
+        """Test error handling when requesting zero or negative subnets."""
+        for num_subnets in (0, -1, -5):
+            with self.subTest(num_subnets=num_subnets):
+                with self.assertRaises(ValueError):
+                    self.calc_c.calculate_from_subnets(num_subnets)
+    
+    def test_error_handling_non_positive_hosts(self):
+        """Test error handling when requesting zero or negative hosts per subnet."""
+        for hosts_per_subnet in (0, -1, -2, -10):
+            with self.subTest(hosts_per_subnet=hosts_per_subnet):
+                with self.assertRaises(ValueError):
+                    self.calc_c.calculate_from_hosts(hosts_per_subnet)
+    
     def test_edge_cases(self):
         """Test edge cases for subnet calculations."""
         # Test with 1 subnet (should work)
@@ -211,6 +352,12 @@ class TestSubnetCalculator(unittest.TestCase):
         # Test with 1 host per subnet
         results = self.calc_c.calculate_from_hosts(1)
         self.assertEqual(results['hosts_per_subnet'], 2)  # Minimum is 2 (network + broadcast = 2 unusable)
+        
+        # Exact powers of two must not round up to an extra bit
+        self.assertEqual(self.calc_a.calculate_from_subnets(2 ** 20)['subnet_bits'], 20)
+        self.assertEqual(self.calc_a.calculate_from_subnets(2 ** 20 + 1)['subnet_bits'], 21)
+        self.assertEqual(self.calc_c.calculate_from_hosts(62)['prefix_length'], 26)
+        self.assertEqual(self.calc_c.calculate_from_hosts(63)['prefix_length'], 25)
 
 
 class TestDependencyManager(unittest.TestCase):
@@ -226,6 +373,17 @@ class TestDependencyManager(unittest.TestCase):
         """Test checking for non-existent dependencies."""
         # Test with a module that definitely doesn't exist
         self.assertFalse(DependencyManager.check_dependency("nonexistent_module_xyz123"))
+        self.assertFalse(DependencyManager.check_dependency("nonexistent_module_xyz123.submodule"))
+    
+    def test_setup_colorama_skips_prompt_without_tty(self):
+        """Test piped runs never block on the colorama install prompt."""
+        with mock.patch.object(DependencyManager, "check_dependency", return_value=False), \
+                mock.patch("sys.stdin") as stdin, \
+                mock.patch("builtins.input") as fake_input:
+            stdin.isatty.return_value = False
+            self.assertFalse(DependencyManager.setup_colorama())
+        
+        fake_input.assert_not_called()
 
 
 class TestColors(unittest.TestCase):
@@ -240,6 +398,7 @@ class TestColors(unittest.TestCase):
         self.assertEqual(colors.GREEN, "")
         self.assertEqual(colors.BLUE, "")
         self.assertEqual(colors.RESET, "")
+        self.assertIs(Colors(use_colors=False), colors)
     
     def test_colors_enabled_without_colorama(self):
         """Test Colors class behavior when colorama is not available."""
@@ -250,6 +409,23 @@ class TestColors(unittest.TestCase):
         self.assertIsInstance(colors.enabled, bool)
 
 
+class TestMain(unittest.TestCase):
+    """Test cases for the command-line entry point."""
+    
+    def test_no_color_skips_argparse(self):
+        """Test --no-color alone is handled without importing argparse."""
+        # A None entry makes any import of argparse raise ImportError
+        with mock.patch.object(sys, "argv", ["subnetta.py", "--no-color"]), \
+                mock.patch.dict(sys.modules, {"argparse": None}), \
+                mock.patch.object(DependencyManager, "setup_colorama") as setup_colorama, \
+                mock.patch("subnetta.display_ascii_banner"), \
+                mock.patch("subnetta.SubnettaApp.run") as run:
+            main()
+        
+        setup_colorama.assert_not_called()
+        run.assert_called_once_with()
+
+
 class TestSubnettingScenarios(unittest.TestCase):
     """Test real-world subnetting scenarios."""
     
@@ -287,6 +463,15 @@ class TestSubnettingScenarios(unittest.TestCase):
         self.assertEqual(results['prefix_length'], 18)
         self.assertEqual(results['total_subnets'], 1024)
         self.assertEqual(results['hosts_per_subnet'], 16382)
+        
+        # Length and indexing come from metadata, without enumerating subnets
+        subnets = results['subnets']
+        self.assertEqual(len(subnets), 1024)
+        self.assertEqual(subnets[1023], ipaddress.IPv4Network("10.255.192.0/18"))
+        self.assertEqual(
+            SubnetCalculator.get_subnet_details(subnets[-1])['last_usable_ip'],
+            '10.255.255.254'
+        )
     
     def test_scenario_point_to_point_links(self):
         """Test point-to-point link subnetting scenario."""
@@ -304,6 +489,11 @@ class TestSubnettingScenarios(unittest.TestCase):
 
 def run_tests():
     """Run all tests with detailed output."""
+    # Spread tests across all cores when pytest-xdist is installed
+    if DependencyManager.check_dependency("pytest") and DependencyManager.check_dependency("xdist"):
+        import pytest
+        return pytest.main(['-n', 'auto', __file__]) == 0
+    
     # Create test suite
     test_suite = unittest.TestSuite()
     
@@ -313,6 +503,7 @@ def run_tests():
         TestSubnetCalculator,
         TestDependencyManager,
         TestColors,
+        TestMain,
         TestSubnettingScenarios
     ]
     